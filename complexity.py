@@ -1,16 +1,51 @@
 #!/usr/bin/env python3
 
-# Use the proper idiom in the main module ...
-# NOTE: See https://docs.python.org/3.12/library/multiprocessing.html#the-spawn-and-forkserver-start-methods
-if __name__ == "__main__":
+# Define function ...
+def surveyAllLands(
+    fname,
+    pname,
+    turboLUT,
+    /,
+    *,
+     dLat = 10.0,
+     dLon = 10.0,
+     nLat = 18,
+     nLon = 36,
+    scale = 100,
+):
+    """Survey the complexity of some land and save it as a PNG
+
+    This function reads in a compressed WKB file of land, counts how many
+    Points describe the exterior rings of the Polygons in each pixel of a
+    global grid and then saves an upscaled (and outlined) image of the counts.
+
+    Parameters
+    ----------
+    fname : str
+        the file name of the compressed WKB file
+    pname : str
+        the file name of the PNG
+    turboLUT : numpy.ndarray
+        the Turbo colour table (as a 256x3 array of uint8)
+    dLat : float, optional
+        the latitude size of each initial pixel (in degrees)
+    dLon : float, optional
+        the longitude size of each initial pixel (in degrees)
+    nLat : int, optional
+        the number of initial pixels in the latitude direction
+    nLon : int, optional
+        the number of initial pixels in the longitude direction
+    scale : int, optional
+        the scale of the final upscaled image
+
+    Notes
+    -----
+    The PNG is saved with fast (rather than good) compression because it is
+    expected to be optimised by the caller afterwards.
+    """
+
     # Import standard modules ...
-    import argparse
     import gzip
-    import json
-    import math
-    import os
-    import subprocess
-    import sysconfig
 
     # Import special modules ...
     try:
@@ -34,6 +69,144 @@ if __name__ == "__main__":
     try:
         import pyguymer3
         import pyguymer3.geo
+    except:
+        raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
+
+    # **************************************************************************
+
+    print(f"Surveying \"{fname}\" ...")
+
+    # Load [Multi]Polygon ...
+    with gzip.open(fname, mode = "rb") as gzObj:
+        allLands = shapely.wkb.load(gzObj)
+
+    # Extract the coordinates in the exterior rings of all of the Polygons, as
+    # well as which ring each coordinate belongs to, in one go ...
+    # NOTE: Given how "allLands" was made, we know that there aren't any invalid
+    #       Polygons, so don't bother checking for them.
+    # NOTE: "shapely.get_coordinates()" returns a single (N, 2) array straight
+    #       from GEOS, rather than making a Python tuple for every coordinate.
+    coords, iRing = shapely.get_coordinates(
+        shapely.get_exterior_ring(
+            pyguymer3.geo.extract_polys(allLands, onlyValid = False, repair = False),
+        ),
+        return_index = True,
+    )                                                                           # [°], [#]
+
+    # Find the pixels that these coordinates correspond to ...
+    iLon = numpy.clip(numpy.floor((coords[:, 0] + 180.0) / dLon).astype(numpy.intp), 0, nLon - 1) # [px]
+    iLat = numpy.clip(numpy.floor(( 90.0 - coords[:, 1]) / dLat).astype(numpy.intp), 0, nLat - 1) # [px]
+
+    # Count the coordinates in each pixel ...
+    # NOTE: This is a single pass over all of the coordinates, with no
+    #       per-Polygon Python overhead. "numpy.bincount()" is a single C loop,
+    #       which is faster than the scatter in "numpy.add.at()".
+    histArr = numpy.bincount(
+        iLat * nLon + iLon,
+        minlength = nLat * nLon,
+    ).reshape(nLat, nLon).astype(numpy.uint64)                                  # [#]
+
+    print(f" > Maximum value = {histArr.max():,d}.")
+
+    # **************************************************************************
+
+    # NOTE: Maximum value = 18.
+    # NOTE: Maximum value = 34.
+    # NOTE: Maximum value = 66.
+
+    # **************************************************************************
+
+    # Find the colour index of each initial pixel ...
+    # NOTE: A count of one maps to an index of round(255 / 66) = 4, therefore
+    #       index 0 is only ever used by empty pixels and it can be re-purposed
+    #       as white in the palette.
+    histImgArr = numpy.clip(numpy.rint(255.0 * histArr.astype(numpy.float64) / 66.0), 0.0, 255.0).astype(numpy.uint8)
+
+    # Upscale array ...
+    # NOTE: Broadcasting each initial pixel into a (scale, scale) block and then
+    #       reshaping writes the upscaled array in one contiguous row-major
+    #       pass, without the intermediate array that two calls to
+    #       "numpy.repeat()" would make.
+    histImgArr = numpy.broadcast_to(
+        histImgArr[:, None, :, None],
+        (nLat, scale, nLon, scale),
+    ).reshape(nLat * scale, nLon * scale)
+
+    # Convert array to image and clean up ...
+    # NOTE: Drawing on an image needs its own writeable copy of the pixels, so
+    #       "PIL.Image.frombuffer()" would not save anything here. Instead, just
+    #       make sure that the array does not outlive the conversion.
+    histImgObj = PIL.Image.fromarray(histImgArr)
+    del histImgArr
+
+    # Make a palette from the Turbo colour table (with white for empty pixels
+    # and outlines) and attach it to the image ...
+    # NOTE: This converts the image from mode "L" to mode "P", which is a third
+    #       of the size of mode "RGB" both in memory and when compressed.
+    palette = turboLUT.copy()
+    palette[0, :] = 255
+    histImgObj.putpalette(palette.tobytes())
+
+    # **************************************************************************
+
+    # Create drawing object ...
+    histDraw = PIL.ImageDraw.Draw(histImgObj)
+
+    # Create short-hands to convert (longitude, latitude) coordinates to (x, y)
+    # pixel locations ...
+    # NOTE: These are broadcast across the (N, 2) coordinate array below.
+    coordSign = numpy.array([1.0, -1.0])
+    coordOffset = numpy.array([180.0, 90.0])                                    # [°]
+    coordScale = numpy.array([float(scale) / dLon, float(scale) / dLat])        # [px/°]
+    coordLimit = numpy.array([float(nLon * scale), float(nLat * scale)])        # [px]
+
+    # Deduce locations ...
+    locs = numpy.clip((coordSign * coords + coordOffset) * coordScale, 0.0, coordLimit) # [px]
+
+    # Loop over exterior rings ...
+    for ringLocs in numpy.split(locs, numpy.flatnonzero(numpy.diff(iRing)) + 1):
+        # Draw exterior ring ...
+        # NOTE: "PIL.ImageDraw.ImageDraw.line()" accepts a flat sequence of
+        #       coordinates, which is built in one go from the array.
+        histDraw.line(
+            ringLocs.ravel().tolist(),
+             fill = 0,
+            width = 1,
+        )
+
+    # **************************************************************************
+
+    print(f"Saving \"{pname}\" ...")
+
+    # Save PNG ...
+    # NOTE: Don't waste time compressing the PNG well, as it is optimised
+    #       afterwards anyway.
+    histImgObj.save(
+        pname,
+        compress_level = 1,
+              optimize = False,
+    )
+
+# Use the proper idiom in the main module ...
+# NOTE: See https://docs.python.org/3.12/library/multiprocessing.html#the-spawn-and-forkserver-start-methods
+if __name__ == "__main__":
+    # Import standard modules ...
+    import argparse
+    import json
+    import multiprocessing
+    import os
+    import subprocess
+    import sysconfig
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Import my modules ...
+    try:
+        import pyguymer3
         import pyguymer3.image
     except:
         raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
@@ -58,6 +231,13 @@ if __name__ == "__main__":
           dest = "dryRun",
           help = "don't run GFT - just assume that all the required GFT output is there already",
     )
+    parser.add_argument(
+        "--jobs",
+        default = None,
+           dest = "jobs",
+           help = "the number of GFT runs, surveys and PNG optimisations to do in parallel (if not provided then one per combination, up to the number of CPUs)",
+           type = int,
+    )
     parser.add_argument(
         "--timeout",
         default = 60.0,
@@ -83,44 +263,79 @@ if __name__ == "__main__":
     with open(f"{pyguymer3.__path__[0]}/data/json/colourTables.json", "rt", encoding = "utf-8") as fObj:
         cts = json.load(fObj)
 
+    # Convert the Turbo colour table to an array ...
+    turboLUT = numpy.asarray(cts["turbo"], dtype = numpy.uint8)
+    assert turboLUT.shape == (256, 3), "the Turbo colour table is not 256 RGB colours"
+
     # **************************************************************************
 
-    # Loop over combinations ...
-    for nAng, neRes, prec, color in combs:
-        # Create short-hands ...
-        # NOTE: Say that 928,000 metres takes 1 hour at 500 knots.
-        freqLand = 8 * 928000 // prec                                           # [#]
-        freqPlot = 928000 // prec                                               # [#]
-        freqSimp = 928000 // prec                                               # [#]
-
-        # Populate GFT command ...
-        cmd = [
-            f"python{sysconfig.get_python_version()}", "-m", "gft",
-            "0.0", "0.0", f"{spd:.1f}",
-            "--duration", "0.01",
-            "--freqLand", f"{freqLand:d}",          # 8 hours land re-evaluation
-            "--freqPlot", f"{freqPlot:d}",          # 1 hour plotting
-            "--freqSimp", f"{freqSimp:d}",          # 1 hour simplification
-            "--GSHHG-resolution", gshhgRes,
-            "--nAng", f"{nAng:d}",                  # LOOP VARIABLE
-            "--NE-resolution", neRes,               # LOOP VARIABLE
-            "--precision", f"{prec:.1f}",           # LOOP VARIABLE
-        ]
-        if args.debug:
-            cmd.append("--debug")
-
-        print(f'Running "{" ".join(cmd)}" ...')
-
-        # Run GFT ...
-        if not args.dryRun:
-            subprocess.run(
-                cmd,
-                   check = False,
-                encoding = "utf-8",
-                  stderr = subprocess.DEVNULL,
-                  stdout = subprocess.DEVNULL,
-                 timeout = None,
-            )
+    # Set the number of parallel jobs if the user did not provide it ...
+    if args.jobs is None:
+        args.jobs = min(len(combs), os.cpu_count() or 1)
+
+    # Initialize list ...
+    results = []
+
+    # Create a pool of workers ...
+    with multiprocessing.Pool(args.jobs) as pool:
+        # Loop over combinations ...
+        for nAng, neRes, prec, color in combs:
+            # Create short-hands ...
+            # NOTE: Say that 928,000 metres takes 1 hour at 500 knots.
+            freqLand = 8 * 928000 // prec                                       # [#]
+            freqPlot = 928000 // prec                                           # [#]
+            freqSimp = 928000 // prec                                           # [#]
+
+            # Populate GFT command ...
+            cmd = [
+                f"python{sysconfig.get_python_version()}", "-m", "gft",
+                "0.0", "0.0", f"{spd:.1f}",
+                "--duration", "0.01",
+                "--freqLand", f"{freqLand:d}",      # 8 hours land re-evaluation
+                "--freqPlot", f"{freqPlot:d}",      # 1 hour plotting
+                "--freqSimp", f"{freqSimp:d}",      # 1 hour simplification
+                "--GSHHG-resolution", gshhgRes,
+                "--nAng", f"{nAng:d}",              # LOOP VARIABLE
+                "--NE-resolution", neRes,           # LOOP VARIABLE
+                "--precision", f"{prec:.1f}",       # LOOP VARIABLE
+            ]
+            if args.debug:
+                cmd.append("--debug")
+
+            print(f'Running "{" ".join(cmd)}" ...')
+
+            # Run GFT asynchronously ...
+            # NOTE: Each combination writes to its own directory, so the runs
+            #       are independent of each other.
+            if not args.dryRun:
+                results.append(
+                    pool.apply_async(
+                        subprocess.run,
+                        [
+                            cmd,
+                        ],
+                        {
+                               "check" : False,
+                            "encoding" : "utf-8",
+                              "stderr" : subprocess.DEVNULL,
+                              "stdout" : subprocess.DEVNULL,
+                             "timeout" : None,
+                        },
+                    )
+                )
+
+        # Close the pool of worker processes and wait for all of the tasks to
+        # finish ...
+        # NOTE: The "__exit__()" call of the context manager for
+        #       "multiprocessing.Pool()" calls "terminate()" instead of
+        #       "join()", so I must manage the pool myself.
+        pool.close()
+        pool.join()
+
+    # Check that all of the tasks were successful (re-raising any exception
+    # from the workers) ...
+    for result in results:
+        result.get()
 
     # **************************************************************************
 
@@ -133,109 +348,77 @@ if __name__ == "__main__":
     # Define scale for final upscaled image ...
     scale = 100
 
-    # Loop over combinations ...
-    for nAng, neRes, prec, color in combs:
-        # Deduce directory name ...
-        dname = f"res={neRes}_cons=2.00e+00_tol=1.00e-10/local=F_nAng={nAng:d}_prec={prec:.2e}"
-
-        # Deduce file name and skip if it is missing ...
-        fname = f"{dname}/allLands.wkb.gz"
-        if not os.path.exists(fname):
-            continue
-
-        print(f"Surveying \"{fname}\" ...")
-
-        # **********************************************************************
-
-        # Initialize array ...
-        histArr = numpy.zeros((nLat, nLon), dtype = numpy.uint64)               # [#]
-
-        # Load [Multi]Polygon ...
-        with gzip.open(fname, mode = "rb") as gzObj:
-            allLands = shapely.wkb.loads(gzObj.read())
-
-        # Loop over Polygons ...
-        for allLand in pyguymer3.geo.extract_polys(allLands, onlyValid = False, repair = False):
-            # Loop over coordinates in the exterior ring ...
-            for coord in allLand.exterior.coords:
-                # Find the pixel that this coordinate corresponds to ...
-                iLon = max(0, min(nLon - 1, math.floor((coord[0] + 180.0) / dLon))) # [px]
-                iLat = max(0, min(nLat - 1, math.floor(( 90.0 - coord[1]) / dLat))) # [px]
-
-                # Increment array ...
-                histArr[iLat, iLon] += 1                                        # [#]
-
-        print(f" > Maximum value = {histArr.max():,d}.")
-
-        # **********************************************************************
-
-        # NOTE: Maximum value = 18.
-        # NOTE: Maximum value = 34.
-        # NOTE: Maximum value = 66.
-
-        # **********************************************************************
-
-        # Initialize array ...
-        histImgArr = numpy.zeros((nLat * scale, nLon * scale, 3), dtype = numpy.uint8)
-
-        # Loop over initial longitudes ...
-        for iLon0 in range(nLon):
-            # Deduce final upscaled indices ...
-            iLon1 =  iLon0      * scale                                         # [px]
-            iLon2 = (iLon0 + 1) * scale                                         # [px]
-
-            # Loop over initial latitudes ...
-            for iLat0 in range(nLat):
-                # Deduce final upscaled indices ...
-                iLat1 =  iLat0      * scale                                     # [px]
-                iLat2 = (iLat0 + 1) * scale                                     # [px]
-
-                # Populate array ...
-                for iLon in range(iLon1, iLon2):
-                    for iLat in range(iLat1, iLat2):
-                        if histArr[iLat0, iLon0] > 0:
-                            color = round(
-                                min(
-                                    255.0,
-                                    255.0 * histArr[iLat0, iLon0].astype(numpy.float64) / 66.0,
-                                )
-                            )
-                            histImgArr[iLat, iLon, :] = cts["turbo"][color][:]
-                        else:
-                            histImgArr[iLat, iLon, :] = 255
-
-        # Convert array to image ...
-        histImgObj = PIL.Image.fromarray(histImgArr)
-
-        # **********************************************************************
-
-        # Create drawing object ...
-        histDraw = PIL.ImageDraw.Draw(histImgObj)
-
-        # Loop over Polygons ...
-        for allLand in pyguymer3.geo.extract_polys(allLands, onlyValid = False, repair = False):
-            # Initialize list ...
-            coords = []                                                         # [px], [px]
-
-            # Loop over coordinates in exterior ring ...
-            for coord in allLand.exterior.coords:
-                # Deduce location and append to list ...
-                x = max(0.0, min(float(nLon * scale), float(scale) * (coord[0] + 180.0) / dLon))    # [px]
-                y = max(0.0, min(float(nLat * scale), float(scale) * ( 90.0 - coord[1]) / dLat))    # [px]
-                coords.append((x, y))                                           # [px], [px]
-
-            # Draw exterior ring ...
-            histDraw.line(coords, fill = (255, 255, 255), width = 1)
-
-        # **********************************************************************
-
-        print(f"Saving \"complexity_res={neRes}_cons=2.00e+00_nAng={nAng:d}_prec={prec:.2e}.png\" ...")
-
-        # Save PNG ...
-        histImgObj.save(f"complexity_res={neRes}_cons=2.00e+00_nAng={nAng:d}_prec={prec:.2e}.png")
-        pyguymer3.image.optimise_image(
-            f"complexity_res={neRes}_cons=2.00e+00_nAng={nAng:d}_prec={prec:.2e}.png",
-              debug = args.debug,
-              strip = True,
-            timeout = args.timeout,
-        )
+    # Initialize lists ...
+    pnames = []
+    results = []
+
+    # Create a pool of workers ...
+    with multiprocessing.Pool(args.jobs) as pool:
+        # Loop over combinations ...
+        for nAng, neRes, prec, color in combs:
+            # Deduce directory name ...
+            dname = f"res={neRes}_cons=2.00e+00_tol=1.00e-10/local=F_nAng={nAng:d}_prec={prec:.2e}"
+
+            # Deduce file name and skip if it is missing ...
+            fname = f"{dname}/allLands.wkb.gz"
+            if not os.path.exists(fname):
+                continue
+
+            # Deduce PNG name and append it to the list ...
+            pname = f"complexity_res={neRes}_cons=2.00e+00_nAng={nAng:d}_prec={prec:.2e}.png"
+            pnames.append(pname)
+
+            # Survey the land asynchronously ...
+            results.append(
+                pool.apply_async(
+                    surveyAllLands,
+                    [
+                        fname,
+                        pname,
+                        turboLUT,
+                    ],
+                    {
+                         "dLat" : dLat,
+                         "dLon" : dLon,
+                         "nLat" : nLat,
+                         "nLon" : nLon,
+                        "scale" : scale,
+                    },
+                )
+            )
+
+        # Close the pool of worker processes and wait for all of the tasks to
+        # finish ...
+        # NOTE: The "__exit__()" call of the context manager for
+        #       "multiprocessing.Pool()" calls "terminate()" instead of
+        #       "join()", so I must manage the pool myself.
+        pool.close()
+        pool.join()
+
+    # Check that all of the tasks were successful (re-raising any exception
+    # from the workers) ...
+    for result in results:
+        result.get()
+
+    # **************************************************************************
+
+    # Create a pool of workers ...
+    with multiprocessing.Pool(args.jobs) as pool:
+        # Loop over PNGs ...
+        for pname in pnames:
+            # Optimise PNG asynchronously ...
+            pyguymer3.image.optimise_image(
+                pname,
+                  debug = args.debug,
+                   pool = pool,
+                  strip = True,
+                timeout = args.timeout,
+            )
+
+        # Close the pool of worker processes and wait for all of the tasks to
+        # finish ...
+        # NOTE: The "__exit__()" call of the context manager for
+        #       "multiprocessing.Pool()" calls "terminate()" instead of
+        #       "join()", so I must manage the pool myself.
+        pool.close()
+        pool.join()
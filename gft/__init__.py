@@ -2,4 +2,7 @@
 
 # Import sub-functions ...
 from .fly import fly
+from .loadCountries import loadCountries
+from .loadPolys import loadPolys
 from .saveAllLands import saveAllLands
+from .saveCountry import saveCountry
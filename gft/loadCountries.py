@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+
+# Import standard modules ...
+import functools
+
+# Define function ...
+@functools.lru_cache(maxsize = 8)
+def loadCountries(
+    neRes,
+    /,
+):
+    """Load the countries from the Natural Earth datasets
+
+    This function reads in all of the records in the Natural Earth countries
+    Shapefile and indexes their geometries by name. The result is cached, so
+    the Shapefile is only read once per resolution per process.
+
+    Parameters
+    ----------
+    neRes : string
+        the resolution of the Natural Earth datasets
+
+    Returns
+    -------
+    countries : dict of tuple of shapely.geometry.polygon.Polygon, shapely.geometry.multipolygon.MultiPolygon
+        the geometries of the countries, keyed by name (the values are tuples
+        because more than one record may share a name)
+
+    Notes
+    -----
+    As the result is cached, it is shared between callers and must not be
+    modified.
+    """
+
+    # Import standard modules ...
+    import pathlib
+
+    # Import special modules ...
+    try:
+        import cartopy
+        cartopy.config.update(
+            {
+                "cache_dir" : pathlib.PosixPath("~/.local/share/cartopy_cache").expanduser(),
+            }
+        )
+    except:
+        raise Exception("\"cartopy\" is not installed; run \"pip install --user Cartopy\"") from None
+
+    # Import my modules ...
+    try:
+        import pyguymer3
+        import pyguymer3.geo
+    except:
+        raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
+
+    # **************************************************************************
+
+    # Deduce Shapefile name ...
+    sfile = cartopy.io.shapereader.natural_earth(
+          category = "cultural",
+              name = "admin_0_countries",
+        resolution = neRes,
+    )
+
+    print(f" > Loading \"{sfile}\" ...")
+
+    # Initialize dictionary ...
+    countries = {}
+
+    # Loop over records ...
+    for record in cartopy.io.shapereader.Reader(sfile).records():
+        # Create short-hand and add this record's geometry to the dictionary ...
+        neName = pyguymer3.geo.getRecordAttribute(record, "NAME")
+        countries[neName] = countries.get(neName, ()) + (record.geometry,)
+
+    # Return answer ...
+    return countries
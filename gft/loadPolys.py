@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def loadPolys(
+    fname,
+    /,
+):
+    """Load the Polygons from a compressed WKB file
+
+    Parameters
+    ----------
+    fname : string
+        the file name of the compressed WKB file
+
+    Returns
+    -------
+    polys : list of shapely.geometry.polygon.Polygon
+        the Polygons
+
+    Notes
+    -----
+    This function does not check if the Polygons are valid, therefore it should
+    only be used on compressed WKB files which were made by GFT itself.
+    """
+
+    # Import standard modules ...
+    import gzip
+
+    # Import special modules ...
+    try:
+        import shapely
+        import shapely.wkb
+    except:
+        raise Exception("\"shapely\" is not installed; run \"pip install --user Shapely\"") from None
+
+    # Import my modules ...
+    try:
+        import pyguymer3
+        import pyguymer3.geo
+    except:
+        raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
+
+    # **************************************************************************
+
+    print(f" > Loading \"{fname}\" ...")
+
+    # Load [Multi]Polygon and return the individual Polygons ...
+    with gzip.open(fname, mode = "rb") as gzObj:
+        return pyguymer3.geo.extract_polys(
+            shapely.wkb.load(gzObj),
+            onlyValid = False,
+               repair = False,
+        )
@@ -22,6 +22,7 @@ def saveAllLands(
               nAng = 9,
              neRes = "110m",
              nIter = 100,
+            pretty = False,
               simp = 0.1,
                tol = 1.0e-10,
 ):
@@ -56,6 +57,9 @@ def saveAllLands(
         the resolution of the Natural Earth datasets
     nIter : int, optional
         the maximum number of iterations (particularly the Vincenty formula)
+    pretty : bool, optional
+        indent and sort the keys of the GeoJSON file (which makes it much
+        larger and much slower to write)
     simp : float, optional
         how much intermediary [Multi]Polygons are simplified by; negative values
         disable simplification (in degrees)
@@ -65,21 +69,12 @@ def saveAllLands(
     """
 
     # Import standard modules ...
-    import glob
     import gzip
+    import multiprocessing
+    import multiprocessing.pool
     import os
-    import pathlib
 
     # Import special modules ...
-    try:
-        import cartopy
-        cartopy.config.update(
-            {
-                "cache_dir" : pathlib.PosixPath("~/.local/share/cartopy_cache").expanduser(),
-            }
-        )
-    except:
-        raise Exception("\"cartopy\" is not installed; run \"pip install --user Cartopy\"") from None
     try:
         import geojson
     except:
@@ -87,7 +82,6 @@ def saveAllLands(
     try:
         import shapely
         import shapely.geometry
-        import shapely.ops
         import shapely.wkb
     except:
         raise Exception("\"shapely\" is not installed; run \"pip install --user Shapely\"") from None
@@ -102,6 +96,11 @@ def saveAllLands(
     except:
         raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
 
+    # Import sub-functions ...
+    from .loadCountries import loadCountries
+    from .loadPolys import loadPolys
+    from .saveCountry import saveCountry
+
     # **************************************************************************
 
     # Create short-hand ...
@@ -109,120 +108,115 @@ def saveAllLands(
 
     # **************************************************************************
 
-    # Deduce Shapefile name ...
-    sfile = cartopy.io.shapereader.natural_earth(
-          category = "cultural",
-              name = "admin_0_countries",
-        resolution = neRes,
-    )
+    # Load the countries ...
+    countries = loadCountries(neRes)
 
     # **************************************************************************
 
-    print(f" > Loading \"{sfile}\" ...")
-
-    # Loop over records ...
-    for record in cartopy.io.shapereader.Reader(sfile).records():
-        # Create short-hand and skip this record if it is not to be avoided ...
-        neName = pyguymer3.geo.getRecordAttribute(record, "NAME")
-        if neName not in avoidCountries:
-            continue
-
-        # Deduce temporary file name and skip record if it exists already ...
-        tmpName = f"{dname}/{record.geometry.centroid.x:+011.6f},{record.geometry.centroid.y:+010.6f},{record.geometry.area:012.7f}.wkb.gz"
-        if os.path.exists(tmpName):
-            continue
-
-        print(f"   > Making \"{tmpName}\" ...")
-
-        # Initialize list ...
-        polys = []
+    # Initialize list ...
+    tasks = []
 
-        # Loop over Polygons ...
-        for poly in pyguymer3.geo.extract_polys(
-            record.geometry,
-            onlyValid = True,
-               repair = True,
-        ):
-            # Check if only Polygons local to the plane should be saved ...
-            if local and maxPlane is not None:
-                # Skip Polygon if it is outside of the maximum possible flying
-                # distance of the plane ...
-                if maxPlane.disjoint(poly):
-                    continue
+    # Loop over countries to be avoided ...
+    for neName in avoidCountries:
+        # Loop over the geometries of this country ...
+        for geometry in countries.get(neName, ()):
+            # Deduce temporary file name and skip geometry if it exists already
+            # ...
+            tmpName = f"{dname}/{geometry.centroid.x:+011.6f},{geometry.centroid.y:+010.6f},{geometry.area:012.7f}.wkb.gz"
+            if os.path.exists(tmpName):
+                continue
 
-                # Throw away all parts of the Polygon that the plane will never
-                # fly to ...
-                poly = maxPlane.intersection(poly)
+            # Append it to the list ...
+            tasks.append((tmpName, geometry))
 
-            # Check if the user wants to buffer the land ...
-            # NOTE: The land should probably be buffered to prohibit planes
-            #       jumping over narrow stretches that are narrower than the
-            #       iteration distance.
-            if dist > 0.0:
-                # Find the buffer of the land ...
-                poly = pyguymer3.geo.buffer(
-                    poly,
-                    dist,
-                            debug = debug,
-                             fill = fill,
-                        fillSpace = fillSpace,
-                    keepInteriors = False,
-                             nAng = nAng,
-                            nIter = nIter,
-                             simp = simp,
-                              tol = tol,
+    # Initialize list ...
+    results = []
+
+    # Check if there are any countries to save ...
+    if tasks:
+        # Create a pool of workers ...
+        # NOTE: Buffering is CPU-bound, so processes (rather than threads) are
+        #       needed to buffer the countries in parallel.
+        # NOTE: There are only a handful of countries to be avoided, and GFT is
+        #       often run several times in parallel, so don't create more
+        #       workers than there are tasks.
+        with multiprocessing.Pool(min(len(tasks), os.cpu_count() or 1)) as pool:
+            # Loop over tasks ...
+            for tmpName, geometry in tasks:
+                # Save the country asynchronously ...
+                results.append(
+                    pool.apply_async(
+                        saveCountry,
+                        [
+                            tmpName,
+                            geometry,
+                        ],
+                        {
+                                "debug" : debug,
+                                 "dist" : dist,
+                                 "fill" : fill,
+                            "fillSpace" : fillSpace,
+                                "local" : local,
+                             "maxPlane" : maxPlane,
+                                 "nAng" : nAng,
+                                "nIter" : nIter,
+                                 "simp" : simp,
+                                  "tol" : tol,
+                        },
+                    )
                 )
 
-            # Add the Polygons to the list ...
-            # NOTE: Given how "poly" was made, we know that there aren't any
-            #       invalid Polygons, so don't bother checking for them.
-            polys += pyguymer3.geo.extract_polys(
-                poly,
-                onlyValid = False,
-                   repair = False,
-            )
-
-        # Skip record if it does not have any Polygons ...
-        if not polys:
-            print("     > Skipped (no Polygons).")
-            continue
-
-        # Convert list of Polygons to a (unified) [Multi]Polygon ...
-        polys = shapely.ops.unary_union(polys).simplify(tol)
-        if debug:
-            pyguymer3.geo.check(polys)
+            # Close the pool of worker processes and wait for all of the tasks
+            # to finish ...
+            # NOTE: The "__exit__()" call of the context manager for
+            #       "multiprocessing.Pool()" calls "terminate()" instead of
+            #       "join()", so I must manage the pool myself.
+            pool.close()
+            pool.join()
 
-        # Save [Multi]Polygon ...
-        with gzip.open(tmpName, mode = "wb", compresslevel = 9) as gzObj:
-            gzObj.write(shapely.wkb.dumps(polys))
+    # Check that all of the tasks were successful (re-raising any exception
+    # from the workers) ...
+    for result in results:
+        result.get()
 
     # **************************************************************************
 
     # Initialize list ...
     polys = []
 
-    # Loop over temporary compressed WKB files ...
-    for tmpName in sorted(glob.glob(f"{dname}/????.??????,???.??????,????.???????.wkb.gz")):
-        print(f" > Loading \"{tmpName}\" ...")
+    # Find the temporary compressed WKB files ...
+    # NOTE: The file names are all the same length (see "tmpName" above), so
+    #       checking the suffix and the length is enough to match them.
+    tmpNames = sorted(
+        entry.path for entry in os.scandir(dname)
+        if entry.name.endswith(".wkb.gz") and len(entry.name) == len("????.??????,???.??????,????.???????.wkb.gz")
+    )
 
-        # Add the individual Polygons to the list ...
+    # Create a pool of worker threads ...
+    # NOTE: Decompressing and parsing the temporary compressed WKB files both
+    #       release the GIL, so threads are sufficient.
+    with multiprocessing.pool.ThreadPool(max(1, min(len(tmpNames), os.cpu_count() or 1))) as pool:
+        # Loop over temporary compressed WKB files ...
         # NOTE: Given how "polys" was made, we know that there aren't any
         #       invalid Polygons, so don't bother checking for them.
-        with gzip.open(tmpName, mode = "rb") as gzObj:
-            polys += pyguymer3.geo.extract_polys(
-                shapely.wkb.loads(gzObj.read()),
-                onlyValid = False,
-                   repair = False,
-            )
+        for tmpPolys in pool.map(loadPolys, tmpNames):
+            # Add the individual Polygons to the list ...
+            polys += tmpPolys
 
     # Return if there isn't any land at this resolution ...
     if not polys:
         return False
 
-    # Convert list of Polygons to a (unified) MultiPolygon ...
+    # Convert list of Polygons to a (unified) and simplified MultiPolygon ...
     # NOTE: Given how "polys" was made, we know that there aren't any invalid
     #       Polygons, so don't bother checking for them.
-    polys = shapely.ops.unary_union(polys).simplify(tol)
+    # NOTE: "shapely.union_all()" passes the whole list to GEOS in one call,
+    #       which performs a cascaded union that already groups the Polygons
+    #       spatially (using an STRtree) before merging them.
+    # NOTE: If the user wants to simplify the MultiPolygon (by more than the
+    #       tolerance) then that coarser simplification subsumes the finer one,
+    #       so only one pass of simplification is needed.
+    polys = shapely.union_all(polys).simplify(max(tol, simp))
     polys = gst.removeInteriorRings(
         polys,
         onlyValid = False,
@@ -231,32 +225,20 @@ def saveAllLands(
     if debug:
         pyguymer3.geo.check(polys)
 
-    # Check if the user wants to simplify the MultiPolygon ...
-    if simp > 0.0:
-        # Simplify MultiPolygon ...
-        # NOTE: Given how "polys" was made, we know that there aren't any
-        #       invalid Polygons, so don't bother checking for them.
-        polys = polys.simplify(simp)
-        polys = gst.removeInteriorRings(
-            polys,
-            onlyValid = False,
-               repair = False,
-        )
-        if debug:
-            pyguymer3.geo.check(polys)
-
     # Save MultiPolygon ...
     with gzip.open(wName, mode = "wb", compresslevel = 9) as gzObj:
         gzObj.write(shapely.wkb.dumps(polys))
 
     # Save MultiPolygon ...
+    # NOTE: Only pretty-print the GeoJSON file if the user asks for it, as
+    #       formatting millions of coordinates is slow.
     with open(gName, "wt", encoding = "utf-8") as fObj:
         geojson.dump(
             polys,
             fObj,
             ensure_ascii = False,
-                  indent = 4,
-               sort_keys = True,
+                  indent = 4 if pretty else None,
+               sort_keys = pretty,
         )
 
     # Return ...
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def saveCountry(
+    tmpName,
+    geometry,
+    /,
+    *,
+        debug = __debug__,
+         dist = -1.0,
+         fill = 1.0,
+    fillSpace = "EuclideanSpace",
+        local = False,
+     maxPlane = None,
+         nAng = 9,
+        nIter = 100,
+         simp = 0.1,
+          tol = 1.0e-10,
+):
+    """Save (optionally buffered) country to a compressed WKB file.
+
+    Parameters
+    ----------
+    tmpName : string
+        the file name of the compressed WKB file
+    geometry : shapely.geometry.polygon.Polygon, shapely.geometry.multipolygon.MultiPolygon
+        the country
+    debug : bool, optional
+        print debug messages
+    dist : float, optional
+        the distance to buffer the country by; negative values disable
+        buffering (in metres)
+    fill : float, optional
+        how many intermediary points are added to fill in the straight lines
+        which connect the points; negative values disable filling
+    fillSpace : str, optional
+        the geometric space to perform the filling in (either "EuclideanSpace"
+        or "GeodesicSpace")
+    local : bool, optional
+        the plot has only local extent
+    maxPlane : shapely.geometry.polygon.Polygon, shapely.geometry.multipolygon.MultiPolygon
+        the maximum possible flying distance (ignoring all land)
+    nAng : int, optional
+        the number of angles around each point that are calculated when
+        buffering
+    nIter : int, optional
+        the maximum number of iterations (particularly the Vincenty formula)
+    simp : float, optional
+        how much intermediary [Multi]Polygons are simplified by; negative values
+        disable simplification (in degrees)
+    tol : float, optional
+        the Euclidean distance that defines two points as being the same (in
+        degrees)
+
+    Returns
+    -------
+    saved : bool
+        whether the compressed WKB file was saved (it is not saved if the
+        country does not have any Polygons)
+
+    Notes
+    -----
+    This function is a module-level function, rather than a nested function
+    within :func:`saveAllLands`, so that it can be pickled and run in a pool of
+    worker processes.
+    """
+
+    # Import standard modules ...
+    import gzip
+
+    # Import special modules ...
+    try:
+        import shapely
+        import shapely.wkb
+    except:
+        raise Exception("\"shapely\" is not installed; run \"pip install --user Shapely\"") from None
+
+    # Import my modules ...
+    try:
+        import pyguymer3
+        import pyguymer3.geo
+    except:
+        raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
+
+    # **************************************************************************
+
+    print(f"   > Making \"{tmpName}\" ...")
+
+    # Initialize list ...
+    polys = []
+
+    # Loop over Polygons ...
+    for poly in pyguymer3.geo.extract_polys(
+        geometry,
+        onlyValid = True,
+           repair = True,
+    ):
+        # Check if only Polygons local to the plane should be saved ...
+        if local and maxPlane is not None:
+            # Skip Polygon if it is outside of the maximum possible flying
+            # distance of the plane ...
+            if maxPlane.disjoint(poly):
+                continue
+
+            # Throw away all parts of the Polygon that the plane will never fly
+            # to ...
+            poly = maxPlane.intersection(poly)
+
+        # Check if the user wants to buffer the land ...
+        # NOTE: The land should probably be buffered to prohibit planes jumping
+        #       over narrow stretches that are narrower than the iteration
+        #       distance.
+        if dist > 0.0:
+            # Find the buffer of the land ...
+            poly = pyguymer3.geo.buffer(
+                poly,
+                dist,
+                        debug = debug,
+                         fill = fill,
+                    fillSpace = fillSpace,
+                keepInteriors = False,
+                         nAng = nAng,
+                        nIter = nIter,
+                         simp = simp,
+                          tol = tol,
+            )
+
+        # Add the Polygons to the list ...
+        # NOTE: Given how "poly" was made, we know that there aren't any invalid
+        #       Polygons, so don't bother checking for them.
+        polys += pyguymer3.geo.extract_polys(
+            poly,
+            onlyValid = False,
+               repair = False,
+        )
+
+    # Return if the country does not have any Polygons ...
+    if not polys:
+        print(f"   > Skipped \"{tmpName}\" (no Polygons).")
+        return False
+
+    # Convert list of Polygons to a (unified) [Multi]Polygon ...
+    polys = shapely.union_all(polys).simplify(tol)
+    if debug:
+        pyguymer3.geo.check(polys)
+
+    # Save [Multi]Polygon ...
+    # NOTE: This is only a temporary file, which is read back in straight
+    #       away, and WKB (being mostly floating-point coordinates) does not
+    #       compress much better at level 9 than at level 6.
+    with gzip.open(tmpName, mode = "wb", compresslevel = 6) as gzObj:
+        gzObj.write(shapely.wkb.dumps(polys))
+
+    # Return ...
+    return True
@@ -1,18 +1,362 @@
 #!/usr/bin/env python3
 
-# Use the proper idiom in the main module ...
-# NOTE: See https://docs.python.org/3.12/library/multiprocessing.html#the-spawn-and-forkserver-start-methods
-if __name__ == "__main__":
+# Import standard modules ...
+import dataclasses
+import functools
+
+# Define class ...
+@dataclasses.dataclass(frozen = True, slots = True)
+class Combo:
+    """A combination of GFT settings
+
+    Parameters
+    ----------
+    nAng : int
+        the number of directions from each point that the plane could fly in
+    neRes : str
+        the resolution of the Natural Earth datasets
+    prec : int
+        the precision of the calculation (in metres)
+    color : tuple of float
+        the colour to plot the limits with
+    lon : float
+        the longitude of the starting point (in degrees)
+    lat : float
+        the latitude of the starting point (in degrees)
+
+    Notes
+    -----
+    The land re-evaluation, simplification and plotting frequencies, as well as
+    the name of the GFT output directory, are derived from the other settings
+    once when the combination is created.
+    """
+
+    nAng: int
+    neRes: str
+    prec: int
+    color: tuple
+    lon: float
+    lat: float
+    freqLand: int = dataclasses.field(init = False)
+    freqPlot: int = dataclasses.field(init = False)
+    freqSimp: int = dataclasses.field(init = False)
+    dname: str = dataclasses.field(init = False)
+
+    def __post_init__(self):
+        # Create short-hands ...
+        # NOTE: Say that 928,000 metres takes 1 hour at 500 knots.
+        # NOTE: The class is frozen, so "object.__setattr__()" must be used.
+        object.__setattr__(self, "freqLand", 8 * 928000 // self.prec)           # [#]
+        object.__setattr__(self, "freqPlot", 928000 // self.prec)               # [#]
+        object.__setattr__(self, "freqSimp", 928000 // self.prec)               # [#]
+
+        # Deduce directory name ...
+        object.__setattr__(self, "dname", f"res={self.neRes}_cons=2.00e+00_tol=1.00e-10/local=F_nAng={self.nAng:d}_prec={self.prec:.2e}/freqLand={self.freqLand:d}_freqSimp={self.freqSimp:d}_lon={self.lon:+011.6f}_lat={self.lat:+010.6f}")
+
+# Define function ...
+def runGFT(
+    cmds,
+    /,
+):
+    """Run a chain of GFT commands one after the other
+
+    Parameters
+    ----------
+    cmds : list of list of str
+        the GFT commands
+
+    Notes
+    -----
+    Each GFT command resumes from the files that the previous command saved,
+    therefore they must not be run concurrently.
+    """
+
+    # Import standard modules ...
+    import subprocess
+
+    # Loop over commands ...
+    for cmd in cmds:
+        # Run GFT ...
+        subprocess.run(
+            cmd,
+               check = False,
+            encoding = "utf-8",
+              stderr = subprocess.DEVNULL,
+              stdout = subprocess.DEVNULL,
+             timeout = None,
+        )
+
+# Define function ...
+@functools.lru_cache(maxsize = 8)
+def loadAllLands(
+    fname,
+    /,
+):
+    """Load all of the land from a compressed WKB file
+
+    Parameters
+    ----------
+    fname : str
+        the file name of the compressed WKB file
+
+    Returns
+    -------
+    polys : tuple of shapely.geometry.polygon.Polygon
+        the Polygons
+
+    Notes
+    -----
+    The result is cached, so each worker process only reads the file once
+    (rather than once per frame). As the result is cached, it is shared between
+    callers and must not be modified.
+    """
+
+    # Import standard modules ...
+    import gzip
+
+    # Import special modules ...
+    try:
+        import shapely
+        import shapely.wkb
+    except:
+        raise Exception("\"shapely\" is not installed; run \"pip install --user Shapely\"") from None
+
+    # Import my modules ...
+    try:
+        import pyguymer3
+        import pyguymer3.geo
+    except:
+        raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
+
+    # **************************************************************************
+
+    # Load [Multi]Polygon ...
+    with gzip.open(fname, mode = "rb") as gzObj:
+        allLands = shapely.wkb.load(gzObj)
+
+    # Simplify [Multi]Polygon ...
+    # NOTE: 0.01° is about 1 km, which is much smaller than a pixel of a frame.
+    allLands = allLands.simplify(0.01)
+
+    # Return answer ...
+    # NOTE: Given how "allLands" was made, we know that there aren't any invalid
+    #       Polygons, so don't bother checking for them.
+    return tuple(pyguymer3.geo.extract_polys(allLands, onlyValid = False, repair = False))
+
+# Define function ...
+@functools.lru_cache(maxsize = 1)
+def createFigure(
+    allLandsName,
+    lon,
+    lat,
+    finishLon,
+    finishLat,
+    midLon,
+    midLat,
+    greatCircleLines,
+    /,
+    *,
+       debug = __debug__,
+    gshhgRes = "l",
+):
+    """Create the figure (and axis) of the background of the flight animation
+
+    Parameters
+    ----------
+    allLandsName : str
+        the file name of the compressed WKB file of all of the land
+    lon : float
+        the longitude of the starting point (in degrees)
+    lat : float
+        the latitude of the starting point (in degrees)
+    finishLon : float
+        the longitude of the finishing point (in degrees)
+    finishLat : float
+        the latitude of the finishing point (in degrees)
+    midLon : float
+        the longitude of the middle of the great circle (in degrees)
+    midLat : float
+        the latitude of the middle of the great circle (in degrees)
+    greatCircleLines : tuple of shapely.geometry.linestring.LineString
+        the LineStrings of the great circle
+    debug : bool, optional
+        print debug messages
+    gshhgRes : string, optional
+        the resolution of the Global Self-Consistent Hierarchical
+        High-Resolution Geography datasets
+
+    Returns
+    -------
+    fg : matplotlib.figure.Figure
+        the figure
+    ax : cartopy.mpl.geoaxes.GeoAxes
+        the axis
+
+    Notes
+    -----
+    Everything drawn by this function is the same in every frame. The result is
+    cached, so each worker process only draws the background once (rather than
+    once per frame) and then re-uses the figure. The caller must remove
+    everything that it adds to the figure before the next frame is drawn.
+    """
+
+    # Import standard modules ...
+    import pathlib
+
+    # Import special modules ...
+    try:
+        import cartopy
+        cartopy.config.update(
+            {
+                "cache_dir" : pathlib.PosixPath("~/.local/share/cartopy_cache").expanduser(),
+            }
+        )
+    except:
+        raise Exception("\"cartopy\" is not installed; run \"pip install --user Cartopy\"") from None
+    try:
+        import matplotlib
+        matplotlib.rcParams.update(
+            {
+                                "backend" : "Agg",                              # NOTE: See https://matplotlib.org/stable/gallery/user_interfaces/canvasagg.html
+                             "figure.dpi" : 300,
+                         "figure.figsize" : (9.6, 7.2),                         # NOTE: See https://github.com/Guymer/misc/blob/main/README.md#matplotlib-figure-sizes
+                              "font.size" : 8,
+                          "path.simplify" : True,
+                "path.simplify_threshold" : 1.0,                                # NOTE: Merge line segments which are within 1 px of each other.
+            }
+        )
+        import matplotlib.pyplot
+    except:
+        raise Exception("\"matplotlib\" is not installed; run \"pip install --user matplotlib\"") from None
+
+    # Import my modules ...
+    try:
+        import pyguymer3
+        import pyguymer3.geo
+    except:
+        raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
+
+    # **************************************************************************
+
+    # Create figure ...
+    fg = matplotlib.pyplot.figure(figsize = (7.2, 7.2))
+
+    # Create axis ...
+    # NOTE: Really, I should be plotting "allLands" to be consistent with
+    #       the planes, however, as each plane (potentially) is using
+    #       different collections of land then I will just use the raw GSHHG
+    #       dataset instead.
+    ax = pyguymer3.geo.add_axis(
+        fg,
+        coastlines_resolution = gshhgRes,
+                        debug = debug,
+                          lat = midLat,
+                          lon = midLon,
+    )
+
+    # Configure axis ...
+    pyguymer3.geo.add_map_background(
+        ax,
+             debug = debug,
+              name = "shaded-relief",
+        resolution = "large8192px",
+    )
+
+    # Plot Polygons ...
+    ax.add_geometries(
+        loadAllLands(allLandsName),
+        cartopy.crs.PlateCarree(),
+            alpha = 0.5,
+        edgecolor = "none",
+        facecolor = "magenta",
+        linewidth = 0.0,
+    )
+
+    # Plot the starting and finishing locations ...
+    # NOTE: As of 5/Dec/2023, the default "zorder" of the coastlines is 1.5,
+    #       the default "zorder" of the gridlines is 2.0 and the default
+    #       "zorder" of the scattered points is 1.0.
+    ax.scatter(
+        [lon, finishLon],
+        [lat, finishLat],
+            color = "gold",
+           marker = "*",
+        transform = cartopy.crs.Geodetic(),
+           zorder = 5.0,
+    )
+
+    # Plot great circle ...
+    ax.add_geometries(
+        greatCircleLines,
+        cartopy.crs.PlateCarree(),
+        edgecolor = "gold",
+        facecolor = "none",
+        linestyle = "dashed",
+        linewidth = 1.0,
+    )
+
+    # Return answer ...
+    return fg, ax
+
+# Define function ...
+def renderFrame(
+    frame,
+    dist,
+    fnames,
+    combs,
+    lon,
+    lat,
+    finishLon,
+    finishLat,
+    midLon,
+    midLat,
+    greatCircleLines,
+    spd,
+    /,
+    *,
+       debug = __debug__,
+    gshhgRes = "l",
+):
+    """Render a frame of the flight animation
+
+    Parameters
+    ----------
+    frame : str
+        the file name of the PNG
+    dist : int
+        the distance that has been flown (in kilometres)
+    fnames : list of str
+        the file names of the compressed WKB files of the limits (one per
+        combination)
+    combs : list of Combo
+        the combinations
+    lon : float
+        the longitude of the starting point (in degrees)
+    lat : float
+        the latitude of the starting point (in degrees)
+    finishLon : float
+        the longitude of the finishing point (in degrees)
+    finishLat : float
+        the latitude of the finishing point (in degrees)
+    midLon : float
+        the longitude of the middle of the great circle (in degrees)
+    midLat : float
+        the latitude of the middle of the great circle (in degrees)
+    greatCircleLines : tuple of shapely.geometry.linestring.LineString
+        the LineStrings of the great circle
+    spd : float
+        the speed of the plane (in knots)
+    debug : bool, optional
+        print debug messages
+    gshhgRes : string, optional
+        the resolution of the Global Self-Consistent Hierarchical
+        High-Resolution Geography datasets
+    """
+
     # Import standard modules ...
-    import argparse
-    import glob
     import gzip
     import os
     import pathlib
-    import platform
-    import shutil
-    import subprocess
-    import sysconfig
 
     # Import special modules ...
     try:
@@ -28,10 +372,12 @@ if __name__ == "__main__":
         import matplotlib
         matplotlib.rcParams.update(
             {
-                       "backend" : "Agg",                                       # NOTE: See https://matplotlib.org/stable/gallery/user_interfaces/canvasagg.html
-                    "figure.dpi" : 300,
-                "figure.figsize" : (9.6, 7.2),                                  # NOTE: See https://github.com/Guymer/misc/blob/main/README.md#matplotlib-figure-sizes
-                     "font.size" : 8,
+                                "backend" : "Agg",                              # NOTE: See https://matplotlib.org/stable/gallery/user_interfaces/canvasagg.html
+                             "figure.dpi" : 300,
+                         "figure.figsize" : (9.6, 7.2),                         # NOTE: See https://github.com/Guymer/misc/blob/main/README.md#matplotlib-figure-sizes
+                              "font.size" : 8,
+                          "path.simplify" : True,
+                "path.simplify_threshold" : 1.0,                                # NOTE: Merge line segments which are within 1 px of each other.
             }
         )
         import matplotlib.pyplot
@@ -48,6 +394,191 @@ if __name__ == "__main__":
     try:
         import pyguymer3
         import pyguymer3.geo
+    except:
+        raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
+
+    # **************************************************************************
+
+    print(f"Making \"{frame}\" ...")
+
+    # Find the figure (and axis) of the background which has been made
+    # already by this worker (or make it if this is the first frame) ...
+    fg, ax = createFigure(
+        f"{os.path.dirname(os.path.dirname(os.path.dirname(fnames[-1])))}/allLands.wkb.gz",
+        lon,
+        lat,
+        finishLon,
+        finishLat,
+        midLon,
+        midLat,
+        greatCircleLines,
+           debug = debug,
+        gshhgRes = gshhgRes,
+    )
+
+    # Initialize lists ...
+    artists = []
+    labels = []
+    lines = []
+
+    # Loop over combinations/files ...
+    for comb, fname in zip(combs, fnames, strict = True):
+        print(f" > Loading \"{fname}\" ...")
+
+        # Load [Multi]LineString ...
+        with gzip.open(fname, mode = "rb") as gzObj:
+            limit = shapely.wkb.load(gzObj)
+
+        # Simplify [Multi]LineString ...
+        # NOTE: 0.01° is about 1 km, which is much smaller than a pixel of a
+        #       frame.
+        limit = limit.simplify(0.01)
+
+        # Plot [Multi]LineString ...
+        # NOTE: Given how "limit" was made, we know that there aren't any
+        #       invalid LineStrings, so don't bother checking for them.
+        artists.append(
+            ax.add_geometries(
+                pyguymer3.geo.extract_lines(limit, onlyValid = False),
+                cartopy.crs.PlateCarree(),
+                edgecolor = comb.color,
+                facecolor = "none",
+                linewidth = 1.0,
+            )
+        )
+
+        # Add an entry to the legend ...
+        labels.append(f"nAng={comb.nAng:d}, res={comb.neRes}, prec={comb.prec:d}")
+        lines.append(matplotlib.lines.Line2D([], [], color = comb.color))
+
+    # Check that the distance isn't too large ...
+    if 1000.0 * float(dist) <= pyguymer3.MAXIMUM_VINCENTY:
+        # Deduce file name and load it if it exists already ...
+        mname = f"{os.path.dirname(frame)}/dist={dist:05d}_maxPlane.wkb.gz"
+        if os.path.exists(mname):
+            # Load [Multi]Polygon ...
+            with gzip.open(mname, mode = "rb") as gzObj:
+                maxPlane = shapely.wkb.load(gzObj)
+        else:
+            # Create the initial starting Point ...
+            plane = shapely.geometry.point.Point(lon, lat)
+
+            # Calculate the maximum distance the plane could have got to ...
+            maxPlane = pyguymer3.geo.buffer(
+                plane,
+                1000.0 * float(dist),
+                debug = debug,
+                 fill = +1.0,
+                 nAng = 361,
+                 simp = -1.0,
+            )
+
+            # Save [Multi]Polygon ...
+            with gzip.open(mname, mode = "wb", compresslevel = 9) as gzObj:
+                gzObj.write(shapely.wkb.dumps(maxPlane))
+
+        # Plot [Multi]Polygon ...
+        artists.append(
+            ax.add_geometries(
+                pyguymer3.geo.extract_polys(maxPlane, onlyValid = False, repair = False),
+                cartopy.crs.PlateCarree(),
+                edgecolor = "gold",
+                facecolor = "none",
+                linewidth = 1.0,
+            )
+        )
+
+    # Create short-hand ...
+    dur = 1000.0 * float(dist) / (1852.0 * spd)                                 # [hr]
+
+    # Configure axis ...
+    artists.append(
+        ax.legend(
+            lines,
+            labels,
+            loc = "lower left",
+        )
+    )
+    ax.set_title(
+        f"{dist:6,d} km ({dur:5.2f} hours)",
+        fontfamily = "monospace",
+               loc = "right",
+    )
+
+    # Configure figure ...
+    fg.tight_layout()
+
+    # Save figure ...
+    fg.savefig(frame)
+
+    # Remove everything that is specific to this frame from the figure, so
+    # that it is ready for the next frame ...
+    for artist in artists:
+        artist.remove()
+    ax.set_title("", loc = "right")
+
+# Define function ...
+def images2mp4s(
+    imgs,
+    maxSizes,
+    /,
+    *,
+          debug = __debug__,
+     ffmpegPath = None,
+    ffprobePath = None,
+            fps = 25.0,
+        timeout = 60.0,
+):
+    """Convert a sequence of images to MP4 videos of different sizes
+
+    This function is like "pyguymer3.media.images2mp4()" except that it makes
+    a MP4 video at the native size as well as one MP4 video for each maximum
+    size, all with a single call to "ffmpeg" so that the images are only read
+    and decoded once.
+
+    Parameters
+    ----------
+    imgs : list of str
+        the list of paths to the input images
+    maxSizes : list of int
+        the maximum sizes (both width and height) of the downscaled MP4 videos
+        (in pixels)
+    debug : bool, optional
+        print debug messages
+    ffmpegPath : str, optional
+        the path to the "ffmpeg" binary (if not provided then Python will
+        attempt to find the binary itself)
+    ffprobePath : str, optional
+        the path to the "ffprobe" binary (if not provided then Python will
+        attempt to find the binary itself)
+    fps : float, optional
+        the framerate
+    timeout : float, optional
+        the timeout for any requests/subprocess calls
+
+    Returns
+    -------
+    paths : list of str
+        the paths to the MP4s in a temporary directory (to be copied/moved by
+        the user themselves), the first one is the native size and the rest
+        are in the same order as the maximum sizes
+
+    Notes
+    -----
+    Unlike "pyguymer3.media.images2mp4()", the MP4 videos are encoded with the
+    "veryfast" preset of libx264 (rather than the "veryslow" preset) and are
+    downscaled with a Lanczos filter. The MP4 videos are slightly larger but
+    they are made much more quickly.
+    """
+
+    # Import standard modules ...
+    import shutil
+    import subprocess
+    import tempfile
+
+    # Import my modules ...
+    try:
+        import pyguymer3
         import pyguymer3.image
         import pyguymer3.media
     except:
@@ -55,6 +586,169 @@ if __name__ == "__main__":
 
     # **************************************************************************
 
+    # Try to find the paths if the user did not provide them ...
+    if ffmpegPath is None:
+        ffmpegPath = shutil.which("ffmpeg")
+    if ffprobePath is None:
+        ffprobePath = shutil.which("ffprobe")
+    assert ffmpegPath is not None, "\"ffmpeg\" is not installed"
+    assert ffprobePath is not None, "\"ffprobe\" is not installed"
+
+    # **************************************************************************
+
+    # Find the dimensions of the input images (assuming that they are all the
+    # same dimensions) ...
+    inputWidth, inputHeight = pyguymer3.image.return_image_size(
+        imgs[0],
+        compressed = False,
+    )                                                                           # [px], [px]
+
+    # Find the dimensions (and aspect ratio) of the cropped input images ...
+    # NOTE: x264 requires that the dimensions are multiples of 2.
+    cropWidth = 2 * (inputWidth // 2)                                           # [px]
+    cropHeight = 2 * (inputHeight // 2)                                         # [px]
+    cropRatio = float(cropWidth) / float(cropHeight)                            # [px/px]
+
+    # Initialize list ...
+    outputSizes = [
+        (cropWidth, cropHeight),
+    ]
+
+    # Loop over maximum sizes ...
+    for maxSize in maxSizes:
+        # Check if the cropped input images are wider/taller than the maximum
+        # size and find the dimensions of the output video ...
+        if cropRatio > 1.0:
+            outputSizes.append((maxSize, 2 * (round(float(maxSize) / cropRatio) // 2)))
+        else:
+            outputSizes.append((2 * (round(float(maxSize) * cropRatio) // 2), maxSize))
+
+    # Create secure output directory ...
+    tmpname = tempfile.mkdtemp(prefix = "images2mp4s.")
+
+    # Determine output video filter graph (crop the input images once and then
+    # split them into one stream per output video) ...
+    filterGraph = f"[0:v]crop={cropWidth:d}:{cropHeight:d}:{(inputWidth - cropWidth) // 2:d}:{(inputHeight - cropHeight) // 2:d},split={len(outputSizes):d}"
+    filterGraph += "".join([f"[s{i:d}]" for i in range(len(outputSizes))])
+    for i, (outputWidth, outputHeight) in enumerate(outputSizes):
+        if (outputWidth, outputHeight) == (cropWidth, cropHeight):
+            filterGraph += f";[s{i:d}]null[v{i:d}]"
+        else:
+            filterGraph += f";[s{i:d}]scale={outputWidth:d}:{outputHeight:d}:flags=lanczos[v{i:d}]"
+
+    # Convert the input images to the output videos ...
+    # NOTE: Audio and subtitle streams are explicitly disabled just to be safe.
+    # NOTE: The input images are streamed to "ffmpeg" one after the other,
+    #       rather than making a directory of numbered symbolic links to them
+    #       for "ffmpeg" to open one at a time.
+    cmd = [
+        ffmpegPath,
+        "-hide_banner",
+        "-probesize", "1G",
+        "-analyzeduration", "1800M",
+        "-f", "image2pipe",
+        "-framerate", f"{fps:.1f}",
+        "-c:v", "png",
+        "-i", "pipe:0",
+        "-filter_complex", filterGraph,
+    ]
+    for i, (outputWidth, outputHeight) in enumerate(outputSizes):
+        cmd += [
+            "-map", f"[v{i:d}]",
+            "-pix_fmt", "yuv420p",
+            "-an",
+            "-sn",
+            "-c:v", "libx264",
+            "-profile:v", pyguymer3.media.return_x264_profile(outputWidth, outputHeight),
+            "-preset", "veryfast",
+            "-level", pyguymer3.media.return_x264_level(outputWidth, outputHeight),
+            "-crf", f"{pyguymer3.media.return_x264_crf(outputWidth, outputHeight):.1f}",
+            "-f", "mp4",
+            "-map_chapters", "-1",
+            "-map_metadata", "-1",
+            "-threads", "0",
+            f"{tmpname}/video{i:d}.mp4",
+        ]
+    if debug:
+        print(f'INFO: {" ".join(cmd)}')
+    with open(f"{tmpname}/ffmpeg.err", "wt", encoding = "utf-8") as fObjErr:
+        with open(f"{tmpname}/ffmpeg.out", "wt", encoding = "utf-8") as fObjOut:
+            with subprocess.Popen(
+                cmd,
+                stderr = fObjErr,
+                 stdin = subprocess.PIPE,
+                stdout = fObjOut,
+            ) as proc:
+                # NOTE: If "ffmpeg" exits early then writing to (or closing) its
+                #       standard input raises a "BrokenPipeError", which is
+                #       ignored so that the exit status is checked below.
+                try:
+                    # Loop over input images ...
+                    for img in imgs:
+                        # Stream the input image ...
+                        with open(img, "rb") as fObj:
+                            shutil.copyfileobj(fObj, proc.stdin)
+
+                    # Tell "ffmpeg" that there are no more input images ...
+                    proc.stdin.close()
+                except BrokenPipeError:
+                    pass
+    if proc.returncode != 0:
+        print(f"ERROR: \"ffmpeg\" failed to convert the input images to MP4s; see \"{tmpname}/ffmpeg.err\" for clues.")
+        raise subprocess.CalledProcessError(proc.returncode, cmd) from None
+
+    # Loop over output videos ...
+    for i in range(len(outputSizes)):
+        # Check libx264 bit-depth ...
+        if pyguymer3.media.return_video_bit_depth(
+            f"{tmpname}/video{i:d}.mp4",
+                  debug = debug,
+            ffprobePath = ffprobePath,
+                timeout = timeout,
+        ) != 8:
+            raise Exception(f"successfully converted the input images to a not-8-bit MP4; see \"{tmpname}\" for clues") from None
+
+        # Optimise output video ...
+        pyguymer3.media.optimise_MP4(
+            f"{tmpname}/video{i:d}.mp4",
+              debug = debug,
+            timeout = timeout,
+        )
+
+    # Return paths to output videos ...
+    return [f"{tmpname}/video{i:d}.mp4" for i in range(len(outputSizes))]
+
+# Use the proper idiom in the main module ...
+# NOTE: See https://docs.python.org/3.12/library/multiprocessing.html#the-spawn-and-forkserver-start-methods
+if __name__ == "__main__":
+    # Import standard modules ...
+    import argparse
+    import gzip
+    import math
+    import multiprocessing
+    import os
+    import platform
+    import shutil
+    import sysconfig
+
+    # Import special modules ...
+    try:
+        import shapely
+        import shapely.geometry
+        import shapely.wkb
+    except:
+        raise Exception("\"shapely\" is not installed; run \"pip install --user Shapely\"") from None
+
+    # Import my modules ...
+    try:
+        import pyguymer3
+        import pyguymer3.geo
+        import pyguymer3.image
+    except:
+        raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
+
+    # **************************************************************************
+
     # Create argument parser and parse the arguments ...
     parser = argparse.ArgumentParser(
            allow_abbrev = False,
@@ -87,6 +781,20 @@ if __name__ == "__main__":
            help = "the path to the \"ffprobe\" binary",
            type = str,
     )
+    parser.add_argument(
+        "--jobs",
+        default = None,
+           dest = "jobs",
+           help = "the number of GFT runs to do in parallel (if not provided then one run per combination, up to the number of CPUs)",
+           type = int,
+    )
+    parser.add_argument(
+        "--render-jobs",
+        default = None,
+           dest = "renderJobs",
+           help = "the number of frames to render in parallel, each of which holds its own copy of the background image and the land in memory (if not provided then up to 4, limited by the number of CPUs)",
+           type = int,
+    )
     parser.add_argument(
         "--plot",
         action = "store_true",
@@ -113,38 +821,20 @@ if __name__ == "__main__":
     finishLon = 24.963341                                                       # [°]
     finishLat = 60.318363                                                       # [°]
 
-    # Find the middle of great circle (which would be the ideal flight plan) ...
-    midLon, midLat = pyguymer3.geo.find_middle_of_great_circle(
-        lon,
-        lat,
-        finishLon,
-        finishLat,
-    )                                                                           # [°], [°]
-
-    # Find the great circle (which would be the ideal flight plan) ...
-    greatCircle = pyguymer3.geo.great_circle(
-            lon,
-            lat,
-            finishLon,
-            finishLat,
-          debug = args.debug,
-        maxdist = 10.0e3,
-    )
-
     # Define combinations ...
     combs = [
-        ( 9, "110m", 116000     , (1.0, 0.0, 0.0, 1.0),),
-        (17,  "50m", 116000 // 2, (0.0, 1.0, 0.0, 1.0),),
-        (33,  "10m", 116000 // 4, (0.0, 0.0, 1.0, 1.0),),
+        Combo( 9, "110m", 116000     , (1.0, 0.0, 0.0, 1.0), lon, lat,),
+        Combo(17,  "50m", 116000 // 2, (0.0, 1.0, 0.0, 1.0), lon, lat,),
+        Combo(33,  "10m", 116000 // 4, (0.0, 0.0, 1.0, 1.0), lon, lat,),
     ]
     spd = 500.0                                                                 # [kts]
 
     # Determine output directory and make it if it is missing ...
     outDir = "_".join(
         [
-            "nAng=" + ",".join([f"{nAng:d}" for nAng, neRes, prec, color in combs]),
-            "neRes=" + ",".join([neRes for nAng, neRes, prec, color in combs]),
-            "prec=" + ",".join([f"{prec:.2e}" for nAng, neRes, prec, color in combs]),
+            "nAng=" + ",".join([f"{comb.nAng:d}" for comb in combs]),
+            "neRes=" + ",".join([comb.neRes for comb in combs]),
+            "prec=" + ",".join([f"{comb.prec:.2e}" for comb in combs]),
         ]
     )
     if not os.path.exists(outDir):
@@ -154,71 +844,166 @@ if __name__ == "__main__":
 
     # **************************************************************************
 
-    # Create the initial starting Point ...
-    plane = shapely.geometry.point.Point(lon, lat)
+    # Deduce file names ...
+    mname = f"{outDir}/lon={lon:+011.6f}_lat={lat:+010.6f}_finishLon={finishLon:+011.6f}_finishLat={finishLat:+010.6f}_middle.wkb.gz"
+    gname = f"{outDir}/lon={lon:+011.6f}_lat={lat:+010.6f}_finishLon={finishLon:+011.6f}_finishLat={finishLat:+010.6f}_greatCircle.wkb.gz"
+
+    # Check if the middle of great circle (which would be the ideal flight
+    # plan) has been found already ...
+    if os.path.exists(mname):
+        # Load Point ...
+        with gzip.open(mname, mode = "rb") as gzObj:
+            middle = shapely.wkb.load(gzObj)
+        midLon, midLat = middle.x, middle.y                                     # [°], [°]
+    else:
+        # Find the middle of great circle ...
+        midLon, midLat = pyguymer3.geo.find_middle_of_great_circle(
+            lon,
+            lat,
+            finishLon,
+            finishLat,
+        )                                                                       # [°], [°]
+
+        # Save Point ...
+        with gzip.open(mname, mode = "wb", compresslevel = 9) as gzObj:
+            gzObj.write(shapely.wkb.dumps(shapely.geometry.point.Point(midLon, midLat)))
+
+    # Check if the great circle (which would be the ideal flight plan) has been
+    # found already ...
+    if os.path.exists(gname):
+        # Load [Multi]LineString ...
+        with gzip.open(gname, mode = "rb") as gzObj:
+            greatCircle = shapely.wkb.load(gzObj)
+    else:
+        # Find the great circle ...
+        greatCircle = pyguymer3.geo.great_circle(
+                lon,
+                lat,
+                finishLon,
+                finishLat,
+              debug = args.debug,
+            maxdist = 10.0e3,
+        )
+
+        # Save [Multi]LineString ...
+        with gzip.open(gname, mode = "wb", compresslevel = 9) as gzObj:
+            gzObj.write(shapely.wkb.dumps(greatCircle))
+
+    # Extract the LineStrings of the great circle ...
+    # NOTE: Given how "greatCircle" was made, we know that there aren't any
+    #       invalid LineStrings, so don't bother checking for them.
+    greatCircleLines = tuple(pyguymer3.geo.extract_lines(greatCircle, onlyValid = False))
 
     # **************************************************************************
 
-    # Loop over hours ...
-    for dur in range(1, 25):
+    # Set the number of parallel GFT runs if the user did not provide it ...
+    if args.jobs is None:
+        args.jobs = min(len(combs), os.cpu_count() or 1)
+
+    # Set the durations to run GFT for ...
+    # NOTE: Each run of GFT resumes from the files that the previous (shorter)
+    #       run saved, therefore the only reason to run the shorter durations
+    #       is to make their maps and animations.
+    if args.plot:
+        durs = list(range(1, 25))                                               # [hr]
+    else:
+        durs = [24]                                                             # [hr]
+
+    # Initialize list ...
+    results = []
+
+    # Create a pool of workers ...
+    with multiprocessing.Pool(args.jobs) as pool:
         # Loop over combinations ...
-        for nAng, neRes, prec, color in combs:
-            # Create short-hands ...
-            # NOTE: Say that 928,000 metres takes 1 hour at 500 knots.
-            freqLand = 8 * 928000 // prec                                       # [#]
-            freqPlot = 928000 // prec                                           # [#]
-            freqSimp = 928000 // prec                                           # [#]
-
-            # Populate GFT command ...
-            cmd = [
-                f"python{sysconfig.get_python_version()}", "-m", "gft",
-                f"{lon:+.6f}", f"{lat:+.6f}", f"{spd:.1f}",
-                "--duration", f"{dur / 24.0:.2f}",  # LOOP VARIABLE
-                "--freqLand", f"{freqLand:d}",      # 8 hours land re-evaluation
-                "--freqPlot", f"{freqPlot:d}",      # 1 hour plotting
-                "--freqSimp", f"{freqSimp:d}",      # 1 hour simplification
-                "--GSHHG-resolution", gshhgRes,
-                "--nAng", f"{nAng:d}",              # LOOP VARIABLE
-                "--NE-resolution", neRes,           # LOOP VARIABLE
-                "--precision", f"{prec:.1f}",       # LOOP VARIABLE
-            ]
-            if args.debug:
-                cmd.append("--debug")
-            if args.plot:
-                cmd.append("--plot")
-
-            print(f'Running "{" ".join(cmd)}" ...')
-
-            # Run GFT ...
-            if not args.dryRun:
-                subprocess.run(
-                    cmd,
-                       check = False,
-                    encoding = "utf-8",
-                      stderr = subprocess.DEVNULL,
-                      stdout = subprocess.DEVNULL,
-                     timeout = None,
+        for comb in combs:
+            # Initialize list ...
+            cmds = []
+
+            # Loop over hours ...
+            for dur in durs:
+                # Create short-hands ...
+                # NOTE: GFT is given the duration in days, rounded to 2 decimal
+                #       places, and it makes the same number of steps as this.
+                durStr = f"{dur / 24.0:.2f}"
+                maxDist = (1852.0 * spd) * (24.0 * float(durStr))               # [m]
+                nstep = round(maxDist / comb.prec)                              # [#]
+
+                # Deduce the file names that this run would make ...
+                fnames = [
+                    f"{comb.dname}/plane/istep={nstep - 1:06d}.wkb.gz",
+                ]
+                if args.plot:
+                    fnames += [
+                        f"{comb.dname}/dur={durStr}_freqPlot={comb.freqPlot:d}_spd={spd:.1f}.png",
+                        f"{comb.dname}/dur={durStr}_freqPlot={comb.freqPlot:d}_spd={spd:.1f}.mp4",
+                        f"{comb.dname}/dur={durStr}_freqPlot={comb.freqPlot:d}_spd={spd:.1f}.webp",
+                    ]
+
+                # Skip this run if it has been done already ...
+                if all(os.path.exists(fname) for fname in fnames):
+                    continue
+
+                # Populate GFT command ...
+                cmd = [
+                    f"python{sysconfig.get_python_version()}", "-m", "gft",
+                    f"{lon:+.6f}", f"{lat:+.6f}", f"{spd:.1f}",
+                    "--duration", durStr,               # LOOP VARIABLE
+                    "--freqLand", f"{comb.freqLand:d}", # 8 hours land re-evaluation
+                    "--freqPlot", f"{comb.freqPlot:d}", # 1 hour plotting
+                    "--freqSimp", f"{comb.freqSimp:d}", # 1 hour simplification
+                    "--GSHHG-resolution", gshhgRes,
+                    "--nAng", f"{comb.nAng:d}",         # LOOP VARIABLE
+                    "--NE-resolution", comb.neRes,      # LOOP VARIABLE
+                    "--precision", f"{comb.prec:.1f}",  # LOOP VARIABLE
+                ]
+                if args.debug:
+                    cmd.append("--debug")
+                if args.plot:
+                    cmd.append("--plot")
+
+                print(f'Running "{" ".join(cmd)}" ...')
+
+                # Append it to the list ...
+                cmds.append(cmd)
+
+            # Run GFT asynchronously ...
+            # NOTE: Each combination writes to its own directory, so the chains
+            #       of runs are independent of each other.
+            if cmds and not args.dryRun:
+                results.append(
+                    pool.apply_async(
+                        runGFT,
+                        [
+                            cmds,
+                        ],
+                    )
                 )
 
-    # **************************************************************************
+        # Close the pool of worker processes and wait for all of the tasks to
+        # finish ...
+        # NOTE: The "__exit__()" call of the context manager for
+        #       "multiprocessing.Pool()" calls "terminate()" instead of
+        #       "join()", so I must manage the pool myself.
+        pool.close()
+        pool.join()
 
-    # Loop over combinations ...
-    for nAng, neRes, prec, color in combs:
-        # Create short-hands ...
-        # NOTE: Say that 928,000 metres takes 1 hour at 500 knots.
-        freqLand = 8 * 928000 // prec                                           # [#]
-        freqPlot = 928000 // prec                                               # [#]
-        freqSimp = 928000 // prec                                               # [#]
+    # Check that all of the tasks were successful (re-raising any exception
+    # from the workers) ...
+    for result in results:
+        result.get()
 
-        # Deduce directory name ...
-        dname = f"res={neRes}_cons=2.00e+00_tol=1.00e-10/local=F_nAng={nAng:d}_prec={prec:.2e}/freqLand={freqLand:d}_freqSimp={freqSimp:d}_lon={lon:+011.6f}_lat={lat:+010.6f}/limit"
+    # **************************************************************************
 
+    # Loop over combinations ...
+    for comb in combs:
         # Find the maximum distance that has been calculated so far ...
-        fname = sorted(glob.glob(f"{dname}/istep=??????.wkb.gz"))[-1]
-        istep = int(os.path.basename(fname).split("=")[1].split(".")[0])        # [#]
+        # NOTE: The step numbers are zero-padded, so the last file name is
+        #       also the largest step number.
+        fname = max(entry.name for entry in os.scandir(f"{comb.dname}/limit") if entry.name.startswith("istep=") and entry.name.endswith(".wkb.gz"))
+        istep = int(fname.split("=")[1].split(".")[0])                          # [#]
 
         # Create short-hands ...
-        maxDist = float(istep * prec)                                           # [m]
+        maxDist = float(istep * comb.prec)                                      # [m]
         maxDur = maxDist / (1852.0 * spd)                                       # [hr]
 
         print(f" > {0.001 * maxDist:,.2f} kilometres of flying is available (which is {maxDur:,.4f} hours).")
@@ -234,239 +1019,155 @@ if __name__ == "__main__":
     # **************************************************************************
     # **************************************************************************
 
-    # Initialize list ...
+    # Find the distance between frames ...
+    # NOTE: A frame is only made when every combination has a file for that
+    #       distance, which is only the case for common multiples of all of the
+    #       precisions.
+    assert all(comb.prec % 1000 == 0 for comb in combs), "the precisions must be whole kilometres"
+    step = math.lcm(*[comb.prec // 1000 for comb in combs])                     # [km]
+
+    # Find the file names of the frames which have been made already and of the
+    # limits which have been calculated for each combination ...
+    # NOTE: Scanning each directory once is much faster than checking if each
+    #       file exists in turn.
+    pngs = {entry.name for entry in os.scandir(f"{outDir}/lon={lon:+011.6f}_lat={lat:+010.6f}")}
+    limits = [{entry.name for entry in os.scandir(f"{comb.dname}/limit")} for comb in combs]
+
+    # Initialize lists ...
     frames = []
-
-    # Loop over distances ...
-    for dist in range(1, 30000 + 1, 1):
-        # Deduce PNG name, if it exists then append it to the list and skip ...
-        frame = f"{outDir}/lon={lon:+011.6f}_lat={lat:+010.6f}/dist={dist:05d}_Flight.png"
-        if os.path.exists(frame):
-            frames.append(frame)
-            continue
-
-        # HACK
-        if dist in (
-            7888,
-            8004,
-            8120,
-            8236,
-        ):
-            print(f"ERROR: Skipping \"{frame}\" as it crashes my MacBook Pro.")
-            continue
-
-        # **********************************************************************
-
-        # Initialize list ...
-        fnames = []
-
-        # Loop over combinations ...
-        for nAng, neRes, prec, color in combs:
-            # Skip if this distance cannot exist (because the precision is too
-            # coarse) and determine the step count ...
-            if (1000 * dist) % prec != 0:
+    results = []
+
+    # Set the number of parallel renders if the user did not provide it ...
+    # NOTE: Each worker keeps its own figure (with the background image and the
+    #       land already drawn on it) for its whole life, so the number of
+    #       workers is limited to keep the memory usage under control.
+    if args.renderJobs is None:
+        args.renderJobs = min(4, os.cpu_count() or 1)
+
+    # Create pools of workers ...
+    # NOTE: Each frame is optimised as soon as it has been rendered, rather
+    #       than in a batch at the end, so that an interrupted run does not
+    #       leave behind frames which the next run skips without ever
+    #       optimising.
+    with multiprocessing.Pool() as optPool, multiprocessing.Pool(args.renderJobs) as renderPool:
+        # Loop over distances ...
+        for dist in range(step, 30000 + 1, step):
+            # Deduce PNG name, if it exists then append it to the list and skip
+            # ...
+            frame = f"{outDir}/lon={lon:+011.6f}_lat={lat:+010.6f}/dist={dist:05d}_Flight.png"
+            if os.path.basename(frame) in pngs:
+                frames.append(frame)
                 continue
-            istep = ((1000 * dist) // prec) - 1                                 # [#]
-
-            # Create short-hands ...
-            # NOTE: Say that 928,000 metres takes 1 hour at 500 knots.
-            freqLand = 8 * 928000 // prec                                       # [#]
-            freqPlot = 928000 // prec                                           # [#]
-            freqSimp = 928000 // prec                                           # [#]
-
-            # Deduce directory name ...
-            dname = f"res={neRes}_cons=2.00e+00_tol=1.00e-10/local=F_nAng={nAng:d}_prec={prec:.2e}/freqLand={freqLand:d}_freqSimp={freqSimp:d}_lon={lon:+011.6f}_lat={lat:+010.6f}/limit"
 
-            # Deduce file name and skip if it is missing ...
-            fname = f"{dname}/istep={istep + 1:06d}.wkb.gz"
-            if not os.path.exists(fname):
+            # HACK
+            if dist in (
+                7888,
+                8004,
+                8120,
+                8236,
+            ):
+                print(f"ERROR: Skipping \"{frame}\" as it crashes my MacBook Pro.")
                 continue
 
-            # Append it to the list ...
-            fnames.append(fname)
+            # ******************************************************************
 
-        # Skip this frame if there are not enough files ...
-        if len(fnames) != len(combs):
-            continue
+            # Initialize list ...
+            fnames = []
 
-        # **********************************************************************
+            # Loop over combinations ...
+            for comb, names in zip(combs, limits, strict = True):
+                # Determine the step count ...
+                # NOTE: The distance is a multiple of every precision, so the
+                #       division is exact.
+                istep = (1000 * dist) // comb.prec                              # [#]
 
-        print(f"Making \"{frame}\" ...")
-
-        # Create figure ...
-        fg = matplotlib.pyplot.figure(figsize = (7.2, 7.2))
-
-        # Create axis ...
-        # NOTE: Really, I should be plotting "allLands" to be consistent with
-        #       the planes, however, as each plane (potentially) is using
-        #       different collections of land then I will just use the raw GSHHG
-        #       dataset instead.
-        ax = pyguymer3.geo.add_axis(
-            fg,
-            coastlines_resolution = gshhgRes,
-                            debug = args.debug,
-                              lat = midLat,
-                              lon = midLon,
-        )
-
-        # Configure axis ...
-        pyguymer3.geo.add_map_background(
-            ax,
-                 debug = args.debug,
-                  name = "shaded-relief",
-            resolution = "large8192px",
-        )
-
-        # Load [Multi]Polygon ...
-        with gzip.open(f"{os.path.dirname(os.path.dirname(os.path.dirname(fnames[-1])))}/allLands.wkb.gz", mode = "rb") as gzObj:
-            allLands = shapely.wkb.loads(gzObj.read())
-
-        # Plot [Multi]Polygon ...
-        # NOTE: Given how "allLands" was made, we know that there aren't any
-        #       invalid Polygons, so don't bother checking for them.
-        ax.add_geometries(
-            pyguymer3.geo.extract_polys(allLands, onlyValid = False, repair = False),
-            cartopy.crs.PlateCarree(),
-                alpha = 0.5,
-            edgecolor = "none",
-            facecolor = "magenta",
-            linewidth = 0.0,
-        )
+                # Deduce file name and skip if it is missing ...
+                fname = f"{comb.dname}/limit/istep={istep:06d}.wkb.gz"
+                if os.path.basename(fname) not in names:
+                    continue
 
-        # Initialize lists ...
-        labels = []
-        lines = []
+                # Append it to the list ...
+                fnames.append(fname)
 
-        # Loop over combinations/files ...
-        for (nAng, neRes, prec, color), fname in zip(combs, fnames, strict = True):
-            print(f" > Loading \"{fname}\" ...")
-
-            # Load [Multi]LineString ...
-            with gzip.open(fname, mode = "rb") as gzObj:
-                limit = shapely.wkb.loads(gzObj.read())
-
-            # Plot [Multi]LineString ...
-            # NOTE: Given how "limit" was made, we know that there aren't any
-            #       invalid LineStrings, so don't bother checking for them.
-            ax.add_geometries(
-                pyguymer3.geo.extract_lines(limit, onlyValid = False),
-                cartopy.crs.PlateCarree(),
-                edgecolor = color,
-                facecolor = "none",
-                linewidth = 1.0,
-            )
-
-            # Add an entry to the legend ...
-            labels.append(f"nAng={nAng:d}, res={neRes}, prec={prec:d}")
-            lines.append(matplotlib.lines.Line2D([], [], color = color))
-
-        # Check that the distance isn't too large ...
-        if 1000.0 * float(dist) <= pyguymer3.MAXIMUM_VINCENTY:
-            # Calculate the maximum distance the plane could have got to ...
-            maxPlane = pyguymer3.geo.buffer(
-                plane,
-                1000.0 * float(dist),
-                debug = args.debug,
-                 fill = +1.0,
-                 nAng = 361,
-                 simp = -1.0,
-            )
+            # Skip this frame if there are not enough files ...
+            if len(fnames) != len(combs):
+                continue
 
-            # Plot [Multi]Polygon ...
-            ax.add_geometries(
-                pyguymer3.geo.extract_polys(maxPlane, onlyValid = False, repair = False),
-                cartopy.crs.PlateCarree(),
-                edgecolor = "gold",
-                facecolor = "none",
-                linewidth = 1.0,
+            # ******************************************************************
+
+            # Render the frame asynchronously and optimise it as soon as it has
+            # been rendered ...
+            results.append(
+                renderPool.apply_async(
+                    renderFrame,
+                    [
+                        frame,
+                        dist,
+                        fnames,
+                        combs,
+                        lon,
+                        lat,
+                        finishLon,
+                        finishLat,
+                        midLon,
+                        midLat,
+                        greatCircleLines,
+                        spd,
+                    ],
+                    {
+                           "debug" : args.debug,
+                        "gshhgRes" : gshhgRes,
+                    },
+                    callback = lambda _, frame = frame: pyguymer3.image.optimise_image(
+                        frame,
+                          debug = args.debug,
+                           pool = optPool,
+                          strip = True,
+                        timeout = args.timeout,
+                    ),
+                )
             )
 
-        # Plot the starting and finishing locations ...
-        # NOTE: As of 5/Dec/2023, the default "zorder" of the coastlines is 1.5,
-        #       the default "zorder" of the gridlines is 2.0 and the default
-        #       "zorder" of the scattered points is 1.0.
-        ax.scatter(
-            [lon, finishLon],
-            [lat, finishLat],
-                color = "gold",
-               marker = "*",
-            transform = cartopy.crs.Geodetic(),
-               zorder = 5.0,
-        )
-
-        # Plot great circle ...
-        ax.add_geometries(
-            pyguymer3.geo.extract_lines(greatCircle, onlyValid = False),
-            cartopy.crs.PlateCarree(),
-            edgecolor = "gold",
-            facecolor = "none",
-            linestyle = "dashed",
-            linewidth = 1.0,
-        )
-
-        # Create short-hand ...
-        dur = 1000.0 * float(dist) / (1852.0 * spd)                             # [hr]
-
-        # Configure axis ...
-        ax.legend(
-            lines,
-            labels,
-            loc = "lower left",
-        )
-        ax.set_title(
-            f"{dist:6,d} km ({dur:5.2f} hours)",
-            fontfamily = "monospace",
-                   loc = "right",
-        )
-
-        # Configure figure ...
-        fg.tight_layout()
+            # Append frame to list ...
+            frames.append(frame)
 
-        # Save figure ...
-        fg.savefig(frame)
-        matplotlib.pyplot.close(fg)
+        # Close the pools of worker processes and wait for all of the tasks to
+        # finish ...
+        # NOTE: The "__exit__()" call of the context manager for
+        #       "multiprocessing.Pool()" calls "terminate()" instead of
+        #       "join()", so I must manage the pools myself.
+        # NOTE: The rendering pool must finish (and therefore run all of its
+        #       callbacks) before the optimisation pool is closed.
+        renderPool.close()
+        renderPool.join()
+        optPool.close()
+        optPool.join()
+
+    # Check that all of the rendering tasks were successful (re-raising any
+    # exception from the workers) ...
+    for result in results:
+        result.get()
 
-        # Optimize PNG ...
-        pyguymer3.image.optimise_image(
-            frame,
-              debug = args.debug,
-              strip = True,
-            timeout = args.timeout,
-        )
+    # **************************************************************************
 
-        # Append frame to list ...
-        frames.append(frame)
+    # Set maximum sizes ...
+    # NOTE: By inspection, the PNG frames are 2,160 px tall/wide.
+    maxSizes = [512, 1024, 2048]                                                # [px]
 
-    # **************************************************************************
+    # Deduce MP4 names ...
+    vnames = [f"{outDir}/lon={lon:+011.6f}_lat={lat:+010.6f}_Flight.mp4"]
+    vnames += [f"{outDir}/lon={lon:+011.6f}_lat={lat:+010.6f}_Flight{maxSize:04d}px.mp4" for maxSize in maxSizes]
 
-    print(f"Making \"{outDir}/lon={lon:+011.6f}_lat={lat:+010.6f}_Flight.mp4\" ...")
+    print("Making " + ", ".join([f"\"{vname}\"" for vname in vnames]) + " ...")
 
-    # Save 25 fps MP4 ...
-    vname = pyguymer3.media.images2mp4(
+    # Save 25 fps MP4s ...
+    tmpNames = images2mp4s(
         frames,
+        maxSizes,
               debug = args.debug,
         ffprobePath = args.ffprobePath,
          ffmpegPath = args.ffmpegPath,
             timeout = args.timeout,
     )
-    shutil.move(vname, f"{outDir}/lon={lon:+011.6f}_lat={lat:+010.6f}_Flight.mp4")
-
-    # Set maximum sizes ...
-    # NOTE: By inspection, the PNG frames are 2,160 px tall/wide.
-    maxSizes = [512, 1024, 2048]                                                # [px]
-
-    # Loop over maximum sizes ...
-    for maxSize in maxSizes:
-        print(f"Making \"{outDir}/lon={lon:+011.6f}_lat={lat:+010.6f}_Flight{maxSize:04d}px.mp4\" ...")
-
-        # Save 25 fps MP4 ...
-        vname = pyguymer3.media.images2mp4(
-            frames,
-                   debug = args.debug,
-             ffprobePath = args.ffprobePath,
-              ffmpegPath = args.ffmpegPath,
-            screenHeight = maxSize,
-             screenWidth = maxSize,
-                 timeout = args.timeout,
-        )
-        shutil.move(vname, f"{outDir}/lon={lon:+011.6f}_lat={lat:+010.6f}_Flight{maxSize:04d}px.mp4")
+    for tmpName, vname in zip(tmpNames, vnames, strict = True):
+        shutil.move(tmpName, vname)